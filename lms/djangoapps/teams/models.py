@@ -294,7 +294,7 @@ class CourseTeamMembership(models.Model):
             course_ids (list of unicode, optional) Course IDs to filter on.
             team_id (unicode, optional): The team_id to filter on.
         """
-        queryset = cls.objects.all()
+        queryset = cls.objects.select_related('team', 'user')
         if username is not None:
             queryset = queryset.filter(user__username=username)
         if course_ids is not None:
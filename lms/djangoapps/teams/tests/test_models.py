@@ -148,6 +148,18 @@ class TeamMembershipTest(SharedModuleStoreTestCase):
             expected_count
         )
 
+    def test_get_memberships_loads_team_and_user(self):
+        """
+        Accessing the team and user of each membership should not issue
+        additional queries.
+        """
+        with self.assertNumQueries(1):
+            memberships = list(CourseTeamMembership.get_memberships(course_ids=[COURSE_KEY1]))
+            self.assertEqual(
+                sorted((membership.team.team_id, membership.user.username) for membership in memberships),
+                [('team1', 'user1'), ('team1', 'user2')]
+            )
+
     @ddt.data(
         ('user1', COURSE_KEY1, True),
         ('user2', COURSE_KEY1, True),
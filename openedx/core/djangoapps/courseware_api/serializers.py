@@ -2,6 +2,8 @@
 Course API Serializers.  Representing course catalog data
 """
 
+from operator import attrgetter
+
 from django.urls import reverse
 from rest_framework import serializers
 
@@ -18,6 +20,7 @@ class _MediaSerializer(serializers.Serializer):  # pylint: disable=abstract-meth
     def __init__(self, uri_attribute, *args, **kwargs):
         super(_MediaSerializer, self).__init__(*args, **kwargs)
         self.uri_attribute = uri_attribute
+        self._get_uri_attribute = attrgetter(uri_attribute)
 
     uri = serializers.SerializerMethodField(source='*')
 
@@ -28,7 +31,7 @@ class _MediaSerializer(serializers.Serializer):  # pylint: disable=abstract-meth
         """
         Get the representation for the media resource's URI
         """
-        return getattr(course_overview, self.uri_attribute)
+        return self._get_uri_attribute(course_overview)
 
 
 class ImageSerializer(serializers.Serializer):  # pylint: disable=abstract-method
@@ -98,16 +101,16 @@ class CourseInfoSerializer(serializers.Serializer):  # pylint: disable=abstract-
         """
         Return course tab metadata.
         """
-        tabs = []
-        for priority, tab in enumerate(get_course_tab_list(course_overview.effective_user, course_overview)):
-            tabs.append({
+        return [
+            {
                 'title': tab.title,
                 'slug': tab.tab_id,
                 'priority': priority,
                 'type': tab.type,
                 'url': tab.link_func(course_overview, reverse),
-            })
-        return tabs
+            }
+            for priority, tab in enumerate(get_course_tab_list(course_overview.effective_user, course_overview))
+        ]
 
     def get_enrollment(self, course_overview):
         """